@@ -41,6 +41,7 @@ DEPS = {
     "jsonschema": "jsonschema >= 4.18.4",
     "lcov-cobertura": "lcov-cobertura >= 2.0.2",
     "matplotlib": "matplotlib >= 3.7.2",
+    "numba": "numba >= 0.58.0",
     "numpy": "numpy >= 1.25.2",
     "pycobertura": "pycobertura >= 3.2.1",
     "Pygments": "Pygments",
@@ -199,7 +200,7 @@ def unit(session):
     if interpreter == PYPY:
         local_deps = pypy_setup(unit_deps, session)
     else:
-        local_deps = unit_deps + (DEPS["scipy"],)
+        local_deps = unit_deps + (DEPS["scipy"], DEPS["numba"])
 
     # Install all test dependencies.
     session.install(*local_deps)
@@ -220,6 +221,7 @@ def cover(session):
     local_deps = BASE_DEPS + (
         DEPS["scipy"],
         DEPS["sympy"],
+        DEPS["numba"],
         DEPS["pytest-cov"],
         DEPS["coverage"],
     )
@@ -18,15 +18,9 @@ each included element multiple times.
 """
 
 import os
+import pathlib
 import types
 
-try:
-    import bezier
-except ImportError:
-    bezier = None
-
-
-SPECIAL_MEMBERS = ("__author__", "__version__")
 UNDOCUMENTED_SPECIAL_MEMBERS = ("__author__",)
 EXPECTED = """\
 bezier package
@@ -56,6 +50,7 @@ Submodules
    bezier.curved_polygon
    bezier.triangle
 """
+EXPECTED_BYTES = EXPECTED.encode("utf-8")
 DESIRED_TEMPLATE = """\
 bezier package
 ==============
@@ -78,9 +73,35 @@ Subpackages
 
    bezier.hazmat
 """
+# NOTE: Only the rewritten file (i.e. not ``EXPECTED``) starts with this.
+DESIRED_CANARY = (
+    b"bezier package\n==============\n\n.. automodule:: bezier\n    :members:"
+)
 _SCRIPTS_DIR = os.path.dirname(__file__)
-_DOCS_DIR = os.path.abspath(os.path.join(_SCRIPTS_DIR, os.pardir, "docs"))
+_ROOT_DIR = os.path.abspath(os.path.join(_SCRIPTS_DIR, os.pardir))
+_DOCS_DIR = os.path.join(_ROOT_DIR, "docs")
 FILENAME = os.path.join(_DOCS_DIR, "python", "reference", "bezier.rst")
+_PACKAGE_INIT = os.path.join(
+    _ROOT_DIR, "src", "python", "bezier", "__init__.py"
+)
+
+
+def import_bezier():
+    """Import the :mod:`bezier` package, if it is installed.
+
+    This is deferred until needed since importing the package is
+    relatively expensive.
+
+    Returns:
+        Optional[module]: The :mod:`bezier` package, or :data:`None` if it
+        can't be imported.
+    """
+    try:
+        import bezier  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+
+    return bezier
 
 
 def get_public_members():
@@ -94,18 +115,25 @@ def get_public_members():
 
     Raises:
         ValueError: If ``__all__`` has repeated elements.
-        ValueError: If the "public" members in ``__init__.py`` don't match
-            the members described in ``__all__``.
+        ValueError: If ``__all__`` names a member that doesn't exist
+            in the package.
+        ValueError: If ``__all__`` contains modules (rather than
+            members defined or imported in ``__init__.py``).
     """
+    bezier = import_bezier()
     if bezier is None:
         return []
 
+    size_all = len(bezier.__all__)
+    all_exports = set(bezier.__all__)
+    if len(all_exports) != size_all:
+        raise ValueError("__all__ has repeated elements")
+
     local_members = []
     all_members = set()
-    for name in dir(bezier):
-        # Filter out non-public.
-        if name.startswith("_") and name not in SPECIAL_MEMBERS:
-            continue
+    for name in bezier.__all__:
+        if not hasattr(bezier, name):
+            raise ValueError("__all__ names a missing member", name)
 
         value = getattr(bezier, name)
         # Filter out imported modules.
@@ -117,16 +145,10 @@ def get_public_members():
         home = getattr(value, "__module__", "bezier")
         if home == "bezier":
             local_members.append(name)
-    size_all = len(bezier.__all__)
-    all_exports = set(bezier.__all__)
-    if len(all_exports) != size_all:
-        raise ValueError("__all__ has repeated elements")
 
     if all_exports != all_members:
         raise ValueError(
-            "__all__ does not agree with the publicly imported members",
-            all_exports,
-            all_members,
+            "__all__ contains a module", sorted(all_exports - all_members)
         )
 
     local_members = [
@@ -153,6 +175,31 @@ def get_desired():
     return DESIRED_TEMPLATE.format(members=members)
 
 
+def is_up_to_date(contents):
+    """Check if ``bezier.rst`` has already been rewritten.
+
+    This is the case if it was modified more recently than both this script
+    and the package ``__init__.py`` and it starts with ``DESIRED_CANARY``.
+    This allows skipping :func:`get_desired` (and hence importing
+    :mod:`bezier`).
+
+    Args:
+        contents (bytes): The current contents of ``bezier.rst``.
+
+    Returns:
+        bool: Indicates if the file is already in the desired state.
+    """
+    if not contents.startswith(DESIRED_CANARY):
+        return False
+
+    modified = os.stat(FILENAME).st_mtime
+    sources = (__file__, _PACKAGE_INIT)
+    return all(
+        os.path.exists(source) and modified > os.stat(source).st_mtime
+        for source in sources
+    )
+
+
 def main():
     """Main entry point to replace autogenerated contents.
 
@@ -160,14 +207,26 @@ def main():
         ValueError: If the file doesn't contain the expected or
             desired contents.
     """
-    with open(FILENAME, "r") as file_obj:
-        contents = file_obj.read()
+    # NOTE: The contents are compared as raw bytes so that the (common)
+    #       case of an already rewritten file doesn't need to be decoded.
+    #       Line endings are normalized (as text mode reading would) so that
+    #       CRLF checkouts / ``sphinx-apidoc`` output still match.
+    path = pathlib.Path(FILENAME)
+    contents = path.read_bytes().replace(b"\r\n", b"\n")
+    if is_up_to_date(contents):
+        return
+
     desired = get_desired()
-    if contents == EXPECTED:
-        with open(FILENAME, "w") as file_obj:
-            file_obj.write(desired)
-    elif contents != desired:
-        raise ValueError("Unexpected contents", contents, "Expected", EXPECTED)
+    if contents == EXPECTED_BYTES:
+        # NOTE: Write bytes so that the newlines don't depend on the platform.
+        path.write_bytes(desired.encode("utf-8"))
+    elif contents != desired.encode("utf-8"):
+        raise ValueError(
+            "Unexpected contents",
+            contents.decode("utf-8"),
+            "Expected",
+            EXPECTED,
+        )
 
 
 if __name__ == "__main__":
@@ -22,6 +22,30 @@ Includes functions for:
    :trim:
 """
 
+import fractions
+import functools
+
+import numpy as np
+
+
+@functools.lru_cache(maxsize=1)
+def _numba():
+    """Get the (optional) Numba module.
+
+    When it is installed, Numba is used to compile numeric evaluators of
+    implicitized polynomials (see :func:`implicitize_curve_numeric`).
+
+    Returns:
+        Optional[module]: The ``numba`` module, or :data:`None` if it is
+        not installed.
+    """
+    try:
+        import numba  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+
+    return numba
+
 
 def to_symbolic(nodes):
     """Convert a 2D NumPy array to a SymPy matrix of rational numbers.
@@ -43,38 +67,19 @@ def to_symbolic(nodes):
     if nodes.ndim != 2:
         raise ValueError("Nodes must be 2-dimensional, not", nodes.ndim)
 
-    return sympy.Matrix(
-        [[sympy.Rational(value) for value in row] for row in nodes]
-    )
-
-
-def curve_weights(degree, s):
-    """Compute de Casteljau weights for a curve.
-
-    .. note::
-
-       This function could be optimized by introducing a cache. However, any
-       code using SymPy is (for now) assumed not to be performance critical.
-
-    Args:
-        degree (int): The degree of a curve.
-        s (sympy.Symbol): The symbol to be used in the weights.
-
-    Returns:
-        sympy.Matrix: The de Casteljau weights for the curve as a
-        ``(degree + 1) x 1`` matrix.
-    """
-    # NOTE: We import SymPy at runtime to avoid the import-time cost for users
-    #       that don't want to do symbolic computation. The ``sympy`` import is
-    #       a tad expensive.
-    import sympy  # pylint: disable=import-outside-toplevel
-
-    return sympy.Matrix(
-        [
-            [sympy.binomial(degree, k) * s**k * (1 - s) ** (degree - k)]
-            for k in range(degree + 1)
+    rows = nodes.tolist()
+    if nodes.dtype.kind in "iu":
+        data = [[sympy.Integer(value) for value in row] for row in rows]
+    else:
+        # NOTE: Passing the exact numerator and denominator to ``Rational``
+        #       skips the (much slower) float handling in the SymPy
+        #       constructor.
+        data = [
+            [sympy.Rational(*value.as_integer_ratio()) for value in row]
+            for row in rows
         ]
-    )
+
+    return sympy.Matrix(data)
 
 
 def curve_as_polynomial(nodes, degree):
@@ -89,20 +94,104 @@ def curve_as_polynomial(nodes, degree):
         Tuple[sympy.Symbol, sympy.Matrix]: Pair of
         * The symbol ``s`` used in the polynomial
         * The curve :math:`B(s)`.
+
+    Raises:
+        ValueError: If ``nodes`` is not 2D.
     """
     # NOTE: We import SymPy at runtime to avoid the import-time cost for users
     #       that don't want to do symbolic computation. The ``sympy`` import is
     #       a tad expensive.
     import sympy  # pylint: disable=import-outside-toplevel
 
-    nodes_sym = to_symbolic(nodes)
+    if nodes.ndim != 2:
+        raise ValueError("Nodes must be 2-dimensional, not", nodes.ndim)
 
     s = sympy.Symbol("s")
-    b_polynomial = nodes_sym * curve_weights(degree, s)
-    b_polynomial.simplify()
+    # NOTE: The coefficients are computed exactly with Python integers and
+    #       fractions, which is much cheaper than multiplying out the
+    #       (symbolic) nodes and de Casteljau weights.
+    b_polynomial = [
+        sympy.Poly(coeffs[::-1], s).as_expr()
+        for coeffs in _monomial_coefficients(nodes, degree)
+    ]
 
     factored = [value.factor() for value in b_polynomial]
-    return s, sympy.Matrix(factored).reshape(*b_polynomial.shape)
+    return s, sympy.Matrix(factored).reshape(len(factored), 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _binoms(n):
+    """Compute a row of Pascal's triangle.
+
+    Args:
+        n (int): The row to compute.
+
+    Returns:
+        Tuple[int, ...]: The binomial coefficients
+        ``C(n, 0), C(n, 1), ..., C(n, n)``.
+    """
+    row = [1]
+    for k in range(1, n + 1):
+        row.append(row[-1] * (n - k + 1) // k)
+
+    return tuple(row)
+
+
+@functools.lru_cache(maxsize=None)
+def _bernstein_to_monomial(degree):
+    r"""Compute the matrix converting Bernstein to monomial coefficients.
+
+    Entry ``(k, j)`` is
+    :math:`(-1)^{k - j} \binom{n}{j} \binom{n - j}{k - j}`, i.e. the
+    coefficient of :math:`s^k` in the Bernstein polynomial
+    :math:`\binom{n}{j} s^j (1 - s)^{n - j}`.
+
+    Args:
+        degree (int): The degree :math:`n` of the Bernstein basis.
+
+    Returns:
+        Tuple[Tuple[int, ...], ...]: The (lower triangular) matrix, with
+        the entries above the diagonal omitted, i.e. row ``k`` has
+        ``k + 1`` entries.
+    """
+    row_n = _binoms(degree)
+    return tuple(
+        tuple(
+            (-1) ** (k - j) * row_n[j] * _binoms(degree - j)[k - j]
+            for j in range(k + 1)
+        )
+        for k in range(degree + 1)
+    )
+
+
+def _monomial_coefficients(nodes, degree):
+    r"""Compute exact monomial coefficients of a B |eacute| zier curve.
+
+    Args:
+        nodes (numpy.ndarray): Nodes defining a B |eacute| zier curve.
+        degree (int): The degree of the curve. This is assumed to
+            correctly correspond to the number of ``nodes``.
+
+    Returns:
+        List[List[fractions.Fraction]]: The coefficients of
+        :math:`1, s, \ldots, s^n` (as exact rationals) for each dimension
+        of the curve.
+    """
+    transform = _bernstein_to_monomial(degree)
+    result = []
+    for row in nodes.tolist():
+        values = [fractions.Fraction(value) for value in row]
+        result.append(
+            [
+                sum(
+                    coeff * value
+                    for coeff, value in zip(transform_row, values)
+                )
+                for transform_row in transform
+            ]
+        )
+
+    return result
 
 
 def implicitize_2d(x_fn, y_fn, s):
@@ -123,7 +212,9 @@ def implicitize_2d(x_fn, y_fn, s):
     import sympy  # pylint: disable=import-outside-toplevel
 
     x_sym, y_sym = sympy.symbols("x, y")
-    return sympy.resultant(x_fn - x_sym, y_fn - y_sym, s).factor()
+    x_poly = sympy.Poly(x_fn - x_sym, s)
+    y_poly = sympy.Poly(y_fn - y_sym, s)
+    return sympy.resultant(x_poly, y_poly).factor()
 
 
 def implicitize_curve(nodes, degree):
@@ -144,6 +235,76 @@ def implicitize_curve(nodes, degree):
         sympy.Expr: The implicitized function :math:`f(x, y)` such that the
         curve satisfies :math:`f(x(s), y(s)) = 0`.
     """
+    return _implicitize_curve_cached(
+        degree, nodes.shape, nodes.dtype.str, nodes.tobytes()
+    )
+
+
+def implicitize_curve_numeric(nodes, degree, use_cse=True):
+    """Implicitize a 2D parametric curve and compile a numeric evaluator.
+
+    The evaluator is generated with :func:`sympy.lambdify` and, if Numba is
+    installed, compiled with :func:`numba.njit`. It accepts either scalars
+    or NumPy arrays for ``x`` and ``y``.
+
+    .. note::
+
+       The compiled evaluator is not cached on disk by Numba, since the
+       source generated by :func:`sympy.lambdify` does not live in a file.
+
+    Args:
+        nodes (numpy.ndarray): Nodes defining a B |eacute| zier curve.
+        degree (int): The degree of the curve. This is assumed to
+            correctly correspond to the number of ``nodes``.
+        use_cse (Optional[bool]): Flag indicating if common subexpressions
+            should be eliminated (via :func:`sympy.cse`) in the generated
+            evaluator. Defaults to :data:`True`.
+
+    Returns:
+        Tuple[sympy.Expr, Callable[[float, float], float]]: Pair of
+
+        * The implicitized function :math:`f(x, y)`
+        * A callable that evaluates :math:`f(x, y)` numerically.
+    """
+    # NOTE: We import SymPy at runtime to avoid the import-time cost for users
+    #       that don't want to do symbolic computation. The ``sympy`` import is
+    #       a tad expensive.
+    import sympy  # pylint: disable=import-outside-toplevel
+
+    f_polynomial = implicitize_curve(nodes, degree)
+    x_sym, y_sym = sympy.symbols("x, y")
+    # NOTE: The exact (rational) coefficients can be far too large for
+    #       64-bit integers (which Numba can't type), so the evaluator uses
+    #       floating point coefficients.
+    evaluate = sympy.lambdify(
+        (x_sym, y_sym), f_polynomial.evalf(), modules="numpy", cse=use_cse
+    )
+
+    numba = _numba()
+    if numba is not None:
+        evaluate = numba.njit(fastmath=True)(evaluate)
+
+    return f_polynomial, evaluate
+
+
+@functools.lru_cache(maxsize=128)
+def _implicitize_curve_cached(degree, shape, dtype, data):
+    """Implicitize a 2D parametric curve, given the raw bytes of the nodes.
+
+    This is cached so that implicitizing the same curve more than once
+    doesn't re-compute the (expensive) resultant.
+
+    Args:
+        degree (int): The degree of the curve.
+        shape (Tuple[int, int]): The shape of the nodes.
+        dtype (str): The data type of the nodes.
+        data (bytes): The nodes, serialized in C order.
+
+    Returns:
+        sympy.Expr: The implicitized function :math:`f(x, y)` such that the
+        curve satisfies :math:`f(x(s), y(s)) = 0`.
+    """
+    nodes = np.frombuffer(data, dtype=dtype).reshape(shape)
     s, b_polynomial = curve_as_polynomial(nodes, degree)
     x_fn, y_fn = b_polynomial
     return implicitize_2d(x_fn, y_fn, s)
@@ -152,10 +313,8 @@ def implicitize_curve(nodes, degree):
 def triangle_weights(degree, s, t):
     """Compute de Casteljau weights for a triangle.
 
-    .. note::
-
-       This function could be optimized by introducing a cache. However, any
-       code using SymPy is (for now) assumed not to be performance critical.
+    The weights are cached on ``(degree, s, t)``, so repeated calls with the
+    same inputs only need to construct a new matrix.
 
     Args:
         degree (int): The degree of a triangle.
@@ -171,20 +330,55 @@ def triangle_weights(degree, s, t):
     #       a tad expensive.
     import sympy  # pylint: disable=import-outside-toplevel
 
+    values = _triangle_weights(degree, s, t)
+    return sympy.Matrix(values).reshape(len(values), 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _triangle_weights(degree, s, t):
+    """Compute (and cache) de Casteljau weights for a triangle.
+
+    Args:
+        degree (int): The degree of a triangle.
+        s (sympy.Symbol): The first symbol to be used in the weights.
+        t (sympy.Symbol): The second symbol to be used in the weights.
+
+    Returns:
+        Tuple[sympy.Expr, ...]: The ``N`` de Casteljau weights for the
+        triangle, where ``N == (degree + 1)(degree + 2) / 2``.
+    """
+    # NOTE: We import SymPy at runtime to avoid the import-time cost for users
+    #       that don't want to do symbolic computation. The ``sympy`` import is
+    #       a tad expensive.
+    import sympy  # pylint: disable=import-outside-toplevel
+
     lambda1 = 1 - s - t
     lambda2 = s
     lambda3 = t
 
-    values = []
-    for k in range(degree + 1):
-        coeff_k = sympy.binomial(degree, k)
-        # N! / i! j! k! = N! / [k! (N - k)!] (i + j)! / [i! j!]
-        for j in range(degree - k + 1):
-            i = degree - j - k
-            coeff = coeff_k * sympy.binomial(degree - k, j)
-            values.append(coeff * lambda1**i * lambda2**j * lambda3**k)
-
-    return sympy.Matrix(values).reshape(len(values), 1)
+    # NOTE: The weights are built up one degree at a time via the recurrence
+    #       ``B_{i, j, k} = lambda1 B_{i - 1, j, k} + lambda2 B_{i, j - 1, k} +
+    #       lambda3 B_{i, j, k - 1}``, where ``rows[k][j]`` holds the weight
+    #       with ``i = level - j - k``. Since each new weight only depends on
+    #       weights with smaller (or equal) ``j`` and ``k``, iterating over
+    #       both in descending order allows ``rows`` to be updated in place.
+    rows = [[sympy.Integer(1)]]
+    for level in range(1, degree + 1):
+        rows.append([])
+        for k in range(level, -1, -1):
+            row = rows[k]
+            row.append(None)
+            for j in range(level - k, -1, -1):
+                terms = []
+                if j + k < level:
+                    terms.append(lambda1 * row[j])
+                if j > 0:
+                    terms.append(lambda2 * row[j - 1])
+                if k > 0:
+                    terms.append(lambda3 * rows[k - 1][j])
+                row[j] = sympy.Add(*terms)
+
+    return tuple(value for row in rows for value in row)
 
 
 def triangle_as_polynomial(nodes, degree):
@@ -209,11 +403,44 @@ def triangle_as_polynomial(nodes, degree):
     nodes_sym = to_symbolic(nodes)
 
     s, t = sympy.symbols("s, t")
-    b_polynomial = nodes_sym * triangle_weights(degree, s, t)
-    b_polynomial.simplify()
+    # NOTE: Multiplying in the ``Poly`` representation (i.e. sparse
+    #       coefficient dictionaries) is much cheaper than multiplying and
+    #       then expanding generic SymPy expressions.
+    weights = _triangle_weight_polys(degree, s, t)
+    b_polynomial = []
+    for row in nodes_sym.tolist():
+        value = sympy.Poly(0, s, t, domain="QQ")
+        for node, weight in zip(row, weights):
+            value += weight.mul_ground(node)
+        b_polynomial.append(value.as_expr())
 
     factored = [value.factor() for value in b_polynomial]
-    return s, t, sympy.Matrix(factored).reshape(*b_polynomial.shape)
+    return s, t, sympy.Matrix(factored).reshape(len(factored), 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _triangle_weight_polys(degree, s, t):
+    """Compute (and cache) de Casteljau weights for a triangle as polynomials.
+
+    Args:
+        degree (int): The degree of a triangle.
+        s (sympy.Symbol): The first symbol to be used in the weights.
+        t (sympy.Symbol): The second symbol to be used in the weights.
+
+    Returns:
+        Tuple[sympy.Poly, ...]: The ``N`` de Casteljau weights for the
+        triangle (over the rationals), where
+        ``N == (degree + 1)(degree + 2) / 2``.
+    """
+    # NOTE: We import SymPy at runtime to avoid the import-time cost for users
+    #       that don't want to do symbolic computation. The ``sympy`` import is
+    #       a tad expensive.
+    import sympy  # pylint: disable=import-outside-toplevel
+
+    return tuple(
+        sympy.Poly(weight, s, t, domain="QQ")
+        for weight in _triangle_weights(degree, s, t)
+    )
 
 
 def implicitize_3d(x_fn, y_fn, z_fn, s, t):
@@ -239,8 +466,12 @@ def implicitize_3d(x_fn, y_fn, z_fn, s, t):
 
     x_sym, y_sym, z_sym = sympy.symbols("x, y, z")
 
-    f_xy = sympy.resultant(x_fn - x_sym, y_fn - y_sym, s)
-    f_yz = sympy.resultant(y_fn - x_sym, z_fn - z_sym, s)
+    # NOTE: ``y_poly`` is shared by both resultants in ``s``.
+    x_poly = sympy.Poly(x_fn - x_sym, s)
+    y_poly = sympy.Poly(y_fn - y_sym, s)
+    z_poly = sympy.Poly(z_fn - z_sym, s)
+    f_xy = sympy.resultant(x_poly, y_poly)
+    f_yz = sympy.resultant(y_poly, z_poly)
     return sympy.resultant(f_xy, f_yz, t).factor()
 
 
@@ -262,6 +493,29 @@ def implicitize_triangle(nodes, degree):
         sympy.Expr: The implicitized function :math:`f(x, y, z)` such that the
         triangle satisfies :math:`f(x(s, t), y(s, t), z(s, t)) = 0`.
     """
+    return _implicitize_triangle_cached(
+        degree, nodes.shape, nodes.dtype.str, nodes.tobytes()
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _implicitize_triangle_cached(degree, shape, dtype, data):
+    """Implicitize a 3D parametric triangle, given the raw bytes of the nodes.
+
+    This is cached so that implicitizing the same triangle more than once
+    doesn't re-compute the (expensive) resultants.
+
+    Args:
+        degree (int): The degree of the triangle.
+        shape (Tuple[int, int]): The shape of the nodes.
+        dtype (str): The data type of the nodes.
+        data (bytes): The nodes, serialized in C order.
+
+    Returns:
+        sympy.Expr: The implicitized function :math:`f(x, y, z)` such that the
+        triangle satisfies :math:`f(x(s, t), y(s, t), z(s, t)) = 0`.
+    """
+    nodes = np.frombuffer(data, dtype=dtype).reshape(shape)
     s, t, b_polynomial = triangle_as_polynomial(nodes, degree)
     x_fn, y_fn, z_fn = b_polynomial
     return implicitize_3d(x_fn, y_fn, z_fn, s, t)
@@ -15,6 +15,10 @@
 #       they were written before ``pytest`` was used in this project (the
 #       original test runner was ``nose``).
 
+import fractions
+import math
+import unittest.mock
+
 import numpy as np
 import pytest
 
@@ -22,6 +26,10 @@ try:
     import sympy
 except ImportError:  # pragma: NO COVER
     sympy = None
+try:
+    import numba
+except ImportError:  # pragma: NO COVER
+    numba = None
 
 
 def sympy_equal(value1, value2):
@@ -37,6 +45,26 @@ def sympy_matrix_equal(value1, value2):
     return difference == sympy.zeros(*value1.shape)
 
 
+class Test__numba:
+    @staticmethod
+    def _call_function_under_test():
+        from bezier import _symbolic
+
+        _symbolic._numba.cache_clear()
+        try:
+            return _symbolic._numba()
+        finally:
+            _symbolic._numba.cache_clear()
+
+    @pytest.mark.skipif(numba is None, reason="Numba not installed")
+    def test_installed(self):
+        assert self._call_function_under_test() is numba
+
+    @unittest.mock.patch.dict("sys.modules", {"numba": None})
+    def test_missing(self):
+        assert self._call_function_under_test() is None
+
+
 class Test_to_symbolic:
     @staticmethod
     def _call_function_under_test(nodes):
@@ -60,54 +88,91 @@ class Test_to_symbolic:
         expected = sympy.Matrix([[1, sympy.Rational(11, 2)], [2, 2]])
         assert nodes_sym == expected
 
+    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
+    def test_integer(self):
+        nodes = np.asfortranarray([[1, 5], [-2, 2]])
+        nodes_sym = self._call_function_under_test(nodes)
+        expected = sympy.Matrix([[1, 5], [-2, 2]])
+        assert nodes_sym == expected
 
-# pylint: disable=too-few-public-methods
-class Test_curve_weights:
+
+class Test_curve_as_polynomial:
     @staticmethod
-    def _call_function_under_test(degree, s):
+    def _call_function_under_test(nodes, degree):
         from bezier import _symbolic
 
-        return _symbolic.curve_weights(degree, s)
+        return _symbolic.curve_as_polynomial(nodes, degree)
 
     @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
     def test_it(self):
-        t = sympy.Symbol("t")
-        weights = self._call_function_under_test(3, t)
-        expected = sympy.Matrix(
-            [
-                [
-                    (1 - t) ** 3,
-                    3 * t * (1 - t) ** 2,
-                    3 * t**2 * (1 - t),
-                    t**3,
-                ]
-            ]
-        ).T
-        assert sympy_matrix_equal(weights, expected)
+        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        s, b_polynomial = self._call_function_under_test(nodes, 2)
+        expected = sympy.Matrix([s, 2 * s * (1 - s)])
+        assert sympy_matrix_equal(b_polynomial, expected)
 
+    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
+    def test_bad_shape(self):
+        nodes = np.empty((1, 1, 1), order="F")
+        with pytest.raises(ValueError) as exc_info:
+            self._call_function_under_test(nodes, 0)
 
-# pylint: enable=too-few-public-methods
+        exc_args = exc_info.value.args
+        assert exc_args == ("Nodes must be 2-dimensional, not", 3)
+
+
+class Test__binoms:
+    @staticmethod
+    def _call_function_under_test(n):
+        from bezier import _symbolic
+
+        return _symbolic._binoms(n)
+
+    def test_small(self):
+        assert self._call_function_under_test(0) == (1,)
+        assert self._call_function_under_test(1) == (1, 1)
+        assert self._call_function_under_test(4) == (1, 4, 6, 4, 1)
+
+    def test_large(self):
+        row = self._call_function_under_test(60)
+        assert row == tuple(math.comb(60, k) for k in range(61))
 
 
 # pylint: disable=too-few-public-methods
-class Test_curve_as_polynomial:
+class Test__bernstein_to_monomial:
     @staticmethod
-    def _call_function_under_test(nodes, degree):
+    def _call_function_under_test(degree):
         from bezier import _symbolic
 
-        return _symbolic.curve_as_polynomial(nodes, degree)
+        return _symbolic._bernstein_to_monomial(degree)
 
-    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
     def test_it(self):
-        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
-        s, b_polynomial = self._call_function_under_test(nodes, 2)
-        expected = sympy.Matrix([s, 2 * s * (1 - s)])
-        assert sympy_matrix_equal(b_polynomial, expected)
+        transform = self._call_function_under_test(3)
+        expected = ((1,), (-3, 3), (3, -6, 3), (-1, 3, -3, 1))
+        assert transform == expected
 
 
 # pylint: enable=too-few-public-methods
 
 
+class Test__monomial_coefficients:
+    @staticmethod
+    def _call_function_under_test(nodes, degree):
+        from bezier import _symbolic
+
+        return _symbolic._monomial_coefficients(nodes, degree)
+
+    def test_it(self):
+        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        coeffs = self._call_function_under_test(nodes, 2)
+        assert coeffs == [[0, 1, 0], [0, 2, -2]]
+
+    def test_exact(self):
+        nodes = np.asfortranarray([[0.1, 1.0]])
+        coeffs = self._call_function_under_test(nodes, 1)
+        one_tenth = fractions.Fraction(*(0.1).as_integer_ratio())
+        assert coeffs == [[one_tenth, 1 - one_tenth]]
+
+
 # pylint: disable=too-few-public-methods
 class Test_implicitize_2d:
     @staticmethod
@@ -137,7 +202,125 @@ class Test_implicitize_2d:
 # pylint: enable=too-few-public-methods
 
 
-# pylint: disable=too-few-public-methods
+class Test_implicitize_curve:
+    @staticmethod
+    def _call_function_under_test(nodes, degree):
+        from bezier import _symbolic
+
+        return _symbolic.implicitize_curve(nodes, degree)
+
+    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
+    def test_it(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 1.0], [2.0, 0.0, 1.0]])
+        f_polynomial = self._call_function_under_test(nodes, 2)
+
+        x_sym, y_sym = sympy.symbols("x, y")
+        expected = (
+            9 * x_sym**2
+            + 6 * x_sym * y_sym
+            - 20 * x_sym
+            + y_sym**2
+            - 8 * y_sym
+            + 12
+        )
+        assert sympy_equal(f_polynomial, expected)
+
+    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
+    def test_cached(self):
+        from bezier import _symbolic
+
+        _symbolic._implicitize_curve_cached.cache_clear()
+        nodes = np.asfortranarray([[0.0, 1.0, 1.0], [2.0, 0.0, 1.0]])
+        f_polynomial1 = self._call_function_under_test(nodes, 2)
+        # A copy with a different memory layout is also a cache hit.
+        with unittest.mock.patch(
+            "bezier._symbolic.curve_as_polynomial"
+        ) as as_polynomial:
+            f_polynomial2 = self._call_function_under_test(
+                np.ascontiguousarray(nodes), 2
+            )
+        as_polynomial.assert_not_called()
+        assert f_polynomial2 is f_polynomial1
+
+
+class Test_implicitize_curve_numeric:
+    @staticmethod
+    def _call_function_under_test(nodes, degree, **kwargs):
+        from bezier import _symbolic
+
+        return _symbolic.implicitize_curve_numeric(nodes, degree, **kwargs)
+
+    def _check(self, **kwargs):
+        nodes = np.asfortranarray([[0.0, 1.0, 1.0], [2.0, 0.0, 1.0]])
+        f_polynomial, evaluate = self._call_function_under_test(
+            nodes, 2, **kwargs
+        )
+
+        x_sym, y_sym = sympy.symbols("x, y")
+        expected = (
+            9 * x_sym**2
+            + 6 * x_sym * y_sym
+            - 20 * x_sym
+            + y_sym**2
+            - 8 * y_sym
+            + 12
+        )
+        assert sympy_equal(f_polynomial, expected)
+        assert evaluate(1.0, 2.0) == 1.0
+        x_vals = np.asfortranarray([0.0, 1.0, 2.0])
+        y_vals = np.asfortranarray([2.0, 1.0, 0.0])
+        assert np.all(evaluate(x_vals, y_vals) == [0.0, 0.0, 8.0])
+        return evaluate
+
+    def _check_non_dyadic(self, **kwargs):
+        # NOTE: The exact coefficients of ``f(x, y)`` for these nodes are
+        #       rationals with numerators and denominators too large to fit
+        #       in 64-bit integers.
+        nodes = np.asfortranarray([[0.1, 0.7, 1.3], [0.2, 1.1, 0.4]])
+        f_polynomial, evaluate = self._call_function_under_test(
+            nodes, 2, **kwargs
+        )
+
+        # Points on the curve.
+        s_vals = np.asfortranarray([0.0, 0.25, 0.5, 1.0])
+        points = (
+            np.outer(nodes[:, 0], (1.0 - s_vals) ** 2)
+            + np.outer(nodes[:, 1], 2.0 * s_vals * (1.0 - s_vals))
+            + np.outer(nodes[:, 2], s_vals**2)
+        )
+        on_curve = evaluate(points[0, :], points[1, :])
+        assert np.allclose(on_curve, 0.0, atol=1e-14)
+        # Points off the curve.
+        x_sym, y_sym = sympy.symbols("x, y")
+        for x_val, y_val in ((0.5, 0.5), (1.0, 1.0)):
+            expected = float(f_polynomial.subs({x_sym: x_val, y_sym: y_val}))
+            assert evaluate(x_val, y_val) == pytest.approx(expected)
+
+    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
+    @pytest.mark.skipif(numba is None, reason="Numba not installed")
+    def test_numba(self):
+        evaluate = self._check()
+        assert isinstance(evaluate, numba.core.registry.CPUDispatcher)
+
+    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
+    @pytest.mark.skipif(numba is None, reason="Numba not installed")
+    def test_numba_non_dyadic(self):
+        self._check_non_dyadic()
+
+    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
+    def test_without_numba(self):
+        with unittest.mock.patch(
+            "bezier._symbolic._numba", return_value=None
+        ) as numba_mock:
+            self._check(use_cse=False)
+        numba_mock.assert_called_once_with()
+
+    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
+    def test_without_numba_non_dyadic(self):
+        with unittest.mock.patch("bezier._symbolic._numba", return_value=None):
+            self._check_non_dyadic()
+
+
 class Test_triangle_weights:
     @staticmethod
     def _call_function_under_test(degree, s, t):
@@ -163,6 +346,59 @@ class Test_triangle_weights:
         ).T
         assert sympy_matrix_equal(weights, expected)
 
+    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
+    def test_cubic(self):
+        s, t = sympy.symbols("s, t")
+        weights = self._call_function_under_test(3, s, t)
+        lambda1 = 1 - s - t
+        expected = sympy.Matrix(
+            [
+                [
+                    lambda1**3,
+                    3 * lambda1**2 * s,
+                    3 * lambda1 * s**2,
+                    s**3,
+                    3 * lambda1**2 * t,
+                    6 * lambda1 * s * t,
+                    3 * s**2 * t,
+                    3 * lambda1 * t**2,
+                    3 * s * t**2,
+                    t**3,
+                ]
+            ]
+        ).T
+        assert sympy_matrix_equal(weights, expected)
+
+    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
+    def test_cached(self):
+        s, t = sympy.symbols("s, t")
+        weights1 = self._call_function_under_test(1, s, t)
+        # Modify the returned matrix in place; the cache must be unaffected.
+        weights1[0, 0] = 0
+        weights2 = self._call_function_under_test(1, s, t)
+        assert weights1 is not weights2
+        assert weights2[0, 0] == 1 - s - t
+
+
+# pylint: disable=too-few-public-methods
+class Test__triangle_weight_polys:
+    @staticmethod
+    def _call_function_under_test(degree, s, t):
+        from bezier import _symbolic
+
+        return _symbolic._triangle_weight_polys(degree, s, t)
+
+    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
+    def test_it(self):
+        s, t = sympy.symbols("s, t")
+        weights = self._call_function_under_test(1, s, t)
+        expected = (
+            sympy.Poly(1 - s - t, s, t, domain="QQ"),
+            sympy.Poly(s, s, t, domain="QQ"),
+            sympy.Poly(t, s, t, domain="QQ"),
+        )
+        assert weights == expected
+
 
 # pylint: enable=too-few-public-methods
 
@@ -204,19 +440,61 @@ class Test_implicitize_3d:
         z_fn = s**2 + t**2
         f_polynomial = self._call_function_under_test(x_fn, y_fn, z_fn, s, t)
 
+        # NOTE: The triangle satisfies ``z = y^2 - 2x``.
+        expected = (2 * x_sym - y_sym**2 + z_sym) ** 2
+        assert sympy_equal(f_polynomial, expected)
+        on_triangle = f_polynomial.subs(
+            {x_sym: x_fn, y_sym: y_fn, z_sym: z_fn}
+        )
+        assert sympy_equal(on_triangle, 0)
+
+
+# pylint: enable=too-few-public-methods
+
+
+class Test_implicitize_triangle:
+    @staticmethod
+    def _call_function_under_test(nodes, degree):
+        from bezier import _symbolic
+
+        return _symbolic.implicitize_triangle(nodes, degree)
+
+    @staticmethod
+    def _get_nodes():
+        return np.asfortranarray(
+            [
+                [0.0, 0.5, 1.0, -0.5, 0.0, -1.0],
+                [0.0, 0.0, 1.0, 0.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 1.0],
+            ]
+        )
+
+    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
+    def test_it(self):
+        f_polynomial = self._call_function_under_test(self._get_nodes(), 2)
+
+        x_sym, y_sym, z_sym = sympy.symbols("x, y, z")
         expected = (
             x_sym**4
-            - 2 * x_sym**3 * y_sym
-            + 2 * x_sym**2 * y_sym**2
-            - 4 * x_sym**2 * y_sym
+            - 2 * x_sym**2 * y_sym
             - 2 * x_sym**2 * z_sym
-            + 4 * x_sym**2
-            + 2 * x_sym * y_sym * z_sym
-            + 4 * x_sym * z_sym
-            - 2 * y_sym**2 * z_sym
+            + y_sym**2
+            - 2 * y_sym * z_sym
             + z_sym**2
-        )
+        ) ** 2
         assert sympy_equal(f_polynomial, expected)
 
+    @pytest.mark.skipif(sympy is None, reason="SymPy not installed")
+    def test_cached(self):
+        from bezier import _symbolic
 
-# pylint: enable=too-few-public-methods
+        _symbolic._implicitize_triangle_cached.cache_clear()
+        f_polynomial1 = self._call_function_under_test(self._get_nodes(), 2)
+        with unittest.mock.patch(
+            "bezier._symbolic.triangle_as_polynomial"
+        ) as as_polynomial:
+            f_polynomial2 = self._call_function_under_test(
+                self._get_nodes(), 2
+            )
+        as_polynomial.assert_not_called()
+        assert f_polynomial2 is f_polynomial1